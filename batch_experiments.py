@@ -1,30 +1,116 @@
 import sys
 import time
 import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 from quantum_coin_experiment import run_experiment
+from quantum_rings_toss import seed_rngs
 from quantum_rings_provider import initialize_quantum_backend
 
 # Check for Quantum Rings token
 has_qr_token = os.environ.get('QUANTUM_RINGS_TOKEN') is not None
 
-def main():
-    print("===== QUANTUM COIN TOSS EXPERIMENTS =====")
-    print("This script will run a series of quantum coin experiments")
-    print("Press Ctrl+C at any time to skip to the next experiment")
+def run_parallel(experiments):
+    """
+    Run independent experiments concurrently in separate processes
     
-    # Check if we can connect to Quantum Rings
-    print("Testing Quantum Rings connection...")
-    try:
-        backend = initialize_quantum_backend()
-        has_qr_backend = not isinstance(backend, __import__('qiskit_aer').AerSimulator)
-        if has_qr_backend:
-            print("✅ Connected to Quantum Rings backend")
-        else:
-            print("⚠️ Using Aer simulator as fallback (Quantum Rings not available)")
-    except Exception as e:
-        print(f"⚠️ Error testing Quantum Rings connection: {e}")
-        has_qr_backend = False
+    Visualization is disabled because matplotlib windows cannot be driven
+    from worker processes. Each worker reseeds its generators with fresh
+    entropy, since forked workers would otherwise all inherit the parent's
+    generator state and produce identical tosses.
+    
+    Args:
+        experiments: List of experiment dicts with "name" and "params"
+    """
+    with ProcessPoolExecutor(max_workers=len(experiments), initializer=seed_rngs) as executor:
+        futures = {
+            executor.submit(run_experiment, **{**experiment["params"], "visualize": False}): experiment["name"]
+            for experiment in experiments
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+                print(f"✅ Completed: {name}")
+            except Exception as e:
+                print(f"❌ {name} failed: {e}")
+
+def run_mpi(experiments, comm):
+    """
+    Distribute experiments across MPI ranks, e.g. with `mpiexec -n 4`
+    
+    Each rank runs its own slice of the experiments without visualization
+    and rank 0 reports the combined results.
+    
+    Args:
+        experiments: List of experiment dicts with "name" and "params"
+        comm: MPI communicator shared by the ranks
+    """
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+    
+    completed = []
+    for experiment in experiments[rank::size]:
+        try:
+            run_experiment(**{**experiment["params"], "visualize": False})
+            completed.append((experiment["name"], None))
+        except Exception as e:
+            completed.append((experiment["name"], str(e)))
+    
+    # Collect the outcome of every rank on rank 0
+    all_completed = comm.gather(completed, root=0)
+    if rank == 0:
+        for rank_results in all_completed:
+            for name, error in rank_results:
+                if error is None:
+                    print(f"✅ Completed: {name}")
+                else:
+                    print(f"❌ {name} failed: {error}")
+
+def main(parallel=False, interactive=True, benchmark=False, mpi=False):
+    """
+    Run the experiment suite
+    
+    Args:
+        parallel: Run all experiments concurrently in worker processes
+        interactive: Pause with a countdown between sequential experiments
+        benchmark: Disable visualization, delays and the countdown
+        mpi: Distribute the experiments across MPI ranks
+    """
+    # Under MPI only rank 0 prints the banner and probes the backend
+    comm = None
+    rank = 0
+    if mpi:
+        try:
+            from mpi4py import MPI
+            comm = MPI.COMM_WORLD
+            rank = comm.Get_rank()
+        except ImportError:
+            print("⚠️ mpi4py is not installed, running experiments locally")
+    
+    has_qr_backend = False
+    if rank == 0:
+        print("===== QUANTUM COIN TOSS EXPERIMENTS =====")
+        print("This script will run a series of quantum coin experiments")
+        print("Press Ctrl+C at any time to skip to the next experiment")
+        
+        # Check if we can connect to Quantum Rings
+        print("Testing Quantum Rings connection...")
+        try:
+            backend = initialize_quantum_backend()
+            has_qr_backend = not isinstance(backend, __import__('qiskit_aer').AerSimulator)
+            if has_qr_backend:
+                print("✅ Connected to Quantum Rings backend")
+            else:
+                print("⚠️ Using Aer simulator as fallback (Quantum Rings not available)")
+        except Exception as e:
+            print(f"⚠️ Error testing Quantum Rings connection: {e}")
+            has_qr_backend = False
+    
+    # Share the probe result with the other ranks
+    if comm is not None:
+        has_qr_backend = comm.bcast(has_qr_backend, root=0)
     
     # List of experiments to run
     experiments = [
@@ -66,6 +152,21 @@ def main():
         }
     ]
     
+    if benchmark:
+        interactive = False
+        for experiment in experiments:
+            experiment["params"].update(visualize=False, delay=0)
+    
+    if comm is not None:
+        run_mpi(experiments, comm)
+        return
+    
+    if parallel:
+        print(f"\nRunning {len(experiments)} experiments in parallel...")
+        run_parallel(experiments)
+        print("\n===== ALL EXPERIMENTS COMPLETED =====")
+        return
+    
     # Run each experiment
     for i, experiment in enumerate(experiments, 1):
         print("\n" + "=" * 50)
@@ -77,7 +178,7 @@ def main():
             run_experiment(**experiment["params"])
             
             # Pause between experiments to let user see results
-            if i < len(experiments):
+            if interactive and i < len(experiments):
                 for countdown in range(5, 0, -1):
                     sys.stdout.write(f"\rStarting next experiment in {countdown} seconds... ")
                     sys.stdout.flush()
@@ -92,8 +193,19 @@ def main():
     print("Results and visualizations have been saved")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run a suite of quantum coin experiments')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run experiments concurrently without visualization')
+    parser.add_argument('--no-interactive', action='store_true',
+                        help='Skip the countdown between experiments')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Disable visualization, delays and the countdown')
+    parser.add_argument('--mpi', action='store_true',
+                        help='Distribute experiments across MPI ranks (requires mpi4py)')
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(parallel=args.parallel, interactive=not args.no_interactive, benchmark=args.benchmark, mpi=args.mpi)
     except KeyboardInterrupt:
         print("\nExperiment suite interrupted by user")
         sys.exit(0)
\ No newline at end of file
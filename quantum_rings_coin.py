@@ -1,7 +1,73 @@
-from qiskit import QuantumCircuit
-from quantum_rings_provider import initialize_quantum_backend, create_rings_backend
+import os
+from functools import lru_cache
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from quantum_rings_provider import initialize_quantum_backend, create_aer_simulator
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Shared local simulator, created once instead of on every toss
+_SIM = create_aer_simulator()
+
+# Rotation angle of the biased coin, bound at run time
+_THETA = Parameter('θ')
+
+# Shared PCG64 generator for classical sampling; reseed it with seed_rng()
+_RNG = np.random.default_rng()
+
+# Set QUANTUM_COIN_STRICT_SIM=1 to run simulated fair tosses through Aer
+# instead of sampling the equivalent Bernoulli distribution with NumPy; the
+# biased coin always runs its Ry circuit on Aer
+STRICT_SIMULATOR = os.environ.get('QUANTUM_COIN_STRICT_SIM', '0') not in ('', '0')
+
+def seed_rng(seed=None):
+    """
+    Reseed the shared generator used for simulated tosses
+    
+    Args:
+        seed: Seed for np.random.default_rng (an int or a SeedSequence);
+              None draws fresh entropy from the OS
+    """
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+@lru_cache(maxsize=1)
+def _hardware_backend():
+    """Connect to the Quantum Rings backend once and reuse it"""
+    return initialize_quantum_backend()
+
+@lru_cache(maxsize=8)
+def _fair_circuit(backend):
+    """Build and transpile the Hadamard + measure circuit for a backend"""
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)  # Hadamard gate to create superposition
+    qc.measure(0, 0)
+    return transpile(qc, backend, optimization_level=3)
+
+@lru_cache(maxsize=8)
+def _biased_circuit(backend):
+    """Build and transpile the parameterized Ry + measure circuit for a backend"""
+    qc = QuantumCircuit(1, 1)
+    # Ry(θ)|0⟩ = cos(θ/2)|0⟩ + sin(θ/2)|1⟩
+    qc.ry(_THETA, 0)
+    qc.measure(0, 0)
+    return transpile(qc, backend)
+
+def _deterministic_counts(bias_angle, shots):
+    """
+    Return the counts for a bias angle whose outcome is certain
+    
+    Ry(0)|0⟩ is always measured as 0 and Ry(π)|0⟩ always as 1, so those
+    angles need no simulation.
+    
+    Returns:
+        dict: Counts for a deterministic angle, otherwise None
+    """
+    p1 = np.sin(bias_angle / 2) ** 2
+    if p1 <= 1e-12:
+        return {'0': shots}
+    if p1 >= 1 - 1e-12:
+        return {'1': shots}
+    return None
 
 def single_quantum_coin_toss(use_hardware=False):
     """
@@ -13,29 +79,17 @@ def single_quantum_coin_toss(use_hardware=False):
     Returns:
         int: 0 or 1 representing the coin toss outcome
     """
-    # Choose the backend
-    if use_hardware:
-        backend = initialize_quantum_backend()
-    else:
-        from qiskit_aer import AerSimulator
-        backend = AerSimulator()
-    
-    # Create a quantum circuit with 1 qubit and 1 classical bit
-    qc = QuantumCircuit(1, 1)
-    
-    # Apply Hadamard gate to create superposition
-    qc.h(0)
-    
-    # Measure the qubit
-    qc.measure(0, 0)
+    # Choose the backend and reuse the pre-built circuit where possible
+    backend = _hardware_backend() if use_hardware else _SIM
+    qc = _fair_circuit(backend)
     
-    # Run the circuit on the simulator
-    job = backend.run(qc, shots=1)
+    # Run the circuit on the simulator, keeping the raw shot instead of
+    # aggregating a counts histogram for a single measurement
+    job = backend.run(qc, shots=1, memory=True)
     result = job.result()
-    counts = result.get_counts()
     
     # Get the outcome (should be either '0' or '1')
-    outcome = list(counts.keys())[0]
+    outcome = result.get_memory()[0]
     
     return int(outcome)
 
@@ -48,40 +102,25 @@ def batched_quantum_coin_toss(batch_size, use_hardware=False):
         use_hardware: Whether to use hardware acceleration
     
     Returns:
-        List of binary outcomes (0 or 1)
+        np.ndarray: int8 array of binary outcomes (0 or 1)
     """
-    # Use module-level circuit caching for better performance
-    if not hasattr(batched_quantum_coin_toss, 'cached_circuit'):
-        from qiskit import QuantumCircuit, transpile
-        
-        # Create the circuit just once
-        qc = QuantumCircuit(1, 1)
-        qc.h(0)  # Hadamard gate to create superposition
-        qc.measure(0, 0)
-        
-        # Get the backend
-        backend = initialize_quantum_backend()
-        
-        # Pre-transpile for performance
-        batched_quantum_coin_toss.cached_circuit = transpile(qc, backend, optimization_level=3)
-        batched_quantum_coin_toss.backend = backend
-    
-    # Reuse the cached circuit and backend
-    qc = batched_quantum_coin_toss.cached_circuit
-    backend = batched_quantum_coin_toss.backend
+    if not use_hardware and not STRICT_SIMULATOR:
+        # Measuring H|0⟩ is an exact Bernoulli(0.5) trial, and a local
+        # simulator only reproduces that with its own PRNG, so sample it
+        # directly instead of dispatching a simulator job
+        return _RNG.integers(0, 2, size=batch_size, dtype=np.int8)
     
-    # Execute the circuit with the requested number of shots
-    job = backend.run(qc, shots=batch_size)
-    counts = job.result().get_counts()
+    # Reuse the cached backend and its pre-transpiled circuit
+    backend = _hardware_backend() if use_hardware else _SIM
+    qc = _fair_circuit(backend)
     
-    # Convert to individual results
-    outcomes = []
-    for outcome, count in counts.items():
-        outcomes.extend([int(outcome)] * count)
+    # Execute the circuit with the requested number of shots, keeping the
+    # per-shot measurements in the order they were taken
+    job = backend.run(qc, shots=batch_size, memory=True)
+    memory = job.result().get_memory()
     
-    # Shuffle to maintain randomness
-    import numpy as np
-    np.random.shuffle(outcomes)
+    # Decode the '0'/'1' bitstrings into an int8 array in one pass
+    outcomes = (np.frombuffer(''.join(memory).encode('ascii'), dtype=np.uint8) - ord('0')).astype(np.int8)
     
     return outcomes
 
@@ -99,24 +138,19 @@ def biased_quantum_coin(bias_angle, shots=1):
         float: Probability of 0
         float: Probability of 1
     """
-    # Use standard simulator for this demonstration
-    from qiskit_aer import AerSimulator
-    backend = AerSimulator()
-    
-    # Create a quantum circuit
-    qc = QuantumCircuit(1, 1)
-    
-    # Apply Ry rotation for bias
-    # Ry(θ)|0⟩ = cos(θ/2)|0⟩ + sin(θ/2)|1⟩
-    qc.ry(bias_angle, 0)
-    
-    # Measure the qubit
-    qc.measure(0, 0)
-    
-    # Run the circuit
-    job = backend.run(qc, shots=shots)
-    result = job.result()
-    counts = result.get_counts()
+    # Skip the simulator when the outcome is known analytically
+    counts = _deterministic_counts(bias_angle, shots)
+    if counts is None:
+        # Use standard simulator for this demonstration
+        backend = _SIM
+        
+        # Bind the bias angle into the cached parameterized circuit
+        qc = _biased_circuit(backend).assign_parameters({_THETA: bias_angle})
+        
+        # Run the circuit
+        job = backend.run(qc, shots=shots)
+        result = job.result()
+        counts = result.get_counts()
     
     # Calculate probabilities
     prob_0 = counts.get('0', 0) / shots
@@ -124,27 +158,62 @@ def biased_quantum_coin(bias_angle, shots=1):
     
     return counts, prob_0, prob_1
 
+def biased_quantum_coin_sweep(angles, shots=1):
+    """
+    Run the biased coin for several rotation angles in a single Aer job
+    
+    All bound circuits are submitted together so the simulator can execute
+    them in parallel instead of dispatching one job per angle.
+    
+    Args:
+        angles: Sequence of bias angles in radians
+        shots: Number of coin tosses to perform per angle
+        
+    Returns:
+        list: (counts, prob_0, prob_1) tuple for each angle, in order
+    """
+    backend = _SIM
+    qc = _biased_circuit(backend)
+    
+    # Only angles with an uncertain outcome need to be simulated
+    all_counts = [_deterministic_counts(angle, shots) for angle in angles]
+    pending = [i for i, counts in enumerate(all_counts) if counts is None]
+    
+    if pending:
+        circuits = [qc.assign_parameters({_THETA: angles[i]}) for i in pending]
+        
+        # Run every remaining angle as one multi-experiment job
+        result = backend.run(circuits, shots=shots).result()
+        for j, i in enumerate(pending):
+            all_counts[i] = result.get_counts(j)
+    
+    return [(counts, counts.get('0', 0) / shots, counts.get('1', 0) / shots)
+            for counts in all_counts]
+
 def plot_bias_experiment():
     """
     Run experiments with different rotation angles and plot the results
     against theoretical predictions
     """
+    # Imported here so that tossing coins does not pay for matplotlib
+    import matplotlib.pyplot as plt
+    
     angles = np.linspace(0, np.pi, 20)
-    prob_ones = []
     
-    for angle in angles:
-        _, _, p1 = biased_quantum_coin(angle, shots=100)
-        prob_ones.append(p1)
+    # Run the whole sweep as a single multi-experiment job
+    sweep = biased_quantum_coin_sweep(angles, shots=100)
+    prob_ones = np.fromiter((p1 for _, _, p1 in sweep), dtype=float, count=len(sweep))
+    theory = np.sin(angles / 2) ** 2
     
     plt.figure(figsize=(10, 6))
     plt.plot(angles, prob_ones, 'bo-', label='Experimental')
-    plt.plot(angles, np.sin(angles/2)**2, 'r-', label='Theoretical: sin²(θ/2)')
+    plt.plot(angles, theory, 'r-', label='Theoretical: sin²(θ/2)')
     plt.xlabel('Rotation Angle (radians)')
     plt.ylabel('Probability of Measuring |1⟩')
     plt.title('Quantum Coin Bias vs. Rotation Angle')
     plt.grid(True)
     plt.legend()
-    plt.savefig('quantum_coin_bias.png')
+    plt.savefig('quantum_coin_bias.png', dpi=100)
     print("\nPlot saved as 'quantum_coin_bias.png'")
 
 if __name__ == "__main__":
@@ -156,9 +225,8 @@ if __name__ == "__main__":
     # Test batched coin tosses
     print("\n=== Batched Quantum Coin Tosses (10) ===")
     results = batched_quantum_coin_toss(10)
-    heads = results.count(0)
-    tails = results.count(1)
-    print(f"Results: {results}")
+    heads, tails = np.bincount(results, minlength=2)
+    print(f"Results: {results.tolist()}")
     print(f"Heads: {heads}, Tails: {tails}")
     
     # Try with Quantum Rings hardware
@@ -171,8 +239,8 @@ if __name__ == "__main__":
     
     # Test biased coin
     print("\n=== Biased Quantum Coin ===")
-    for angle in [0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi]:
-        counts, p0, p1 = biased_quantum_coin(angle, shots=100)
+    angles = [0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi]
+    for angle, (counts, p0, p1) in zip(angles, biased_quantum_coin_sweep(angles, shots=100)):
         print(f"Angle: {angle:.2f} radians")
         print(f"Counts: {counts}")
         print(f"Probability of 0: {p0:.4f}, Probability of 1: {p1:.4f}")
@@ -1,6 +1,24 @@
 import os
+from functools import lru_cache
 from qiskit_aer import AerSimulator
-import warnings
+
+@lru_cache(maxsize=1)
+def create_aer_simulator():
+    """
+    Create a local Aer simulator, preferring the GPU when one is available
+    
+    The simulator is created once and shared by all callers.
+    
+    Returns:
+        AerSimulator running on the GPU if the installed qiskit-aer build
+        supports it, otherwise on the CPU
+    """
+    try:
+        if 'GPU' in AerSimulator().available_devices():
+            return AerSimulator(method='statevector', device='GPU')
+    except Exception as e:
+        print(f"GPU simulator unavailable ({e}), using CPU")
+    return AerSimulator()
 
 def create_rings_backend(token=None, url=None):
     """
@@ -14,9 +32,8 @@ def create_rings_backend(token=None, url=None):
         Backend object for executing quantum circuits
     """
     try:
-        # Try to import QuantumRings and Qiskit providers
+        # Try to import QuantumRings
         from quantumrings import QuantumRings
-        from qiskit.providers import BackendV2 
         
         # Get token from environment if not provided
         if token is None:
@@ -46,11 +63,11 @@ def create_rings_backend(token=None, url=None):
     except ImportError as e:
         print(f"Error importing Quantum Rings: {e}")
         print("Using Qiskit Aer simulator as fallback")
-        return AerSimulator()
+        return create_aer_simulator()
     except Exception as e:
         print(f"Error connecting to Quantum Rings: {e}")
         print("Using Qiskit Aer simulator as fallback")
-        return AerSimulator()
+        return create_aer_simulator()
 
 def initialize_quantum_backend():
     """
@@ -64,16 +81,15 @@ def initialize_quantum_backend():
     try:
         backend = create_rings_backend()
         if isinstance(backend, AerSimulator):
-            # Fallback occurred, so we'll simulate Quantum Rings
-            simulator = AerSimulator()
+            # Fallback occurred, so the shared simulator stands in for Quantum Rings
             print("Connected to simulated Quantum Rings backend")
-            return simulator
+            return backend
         else:
             print("Connected to real Quantum Rings backend")
             return backend
     except:
         # If all else fails, use a standard simulator
-        simulator = AerSimulator()
+        simulator = create_aer_simulator()
         print("Connected to simulated Quantum Rings backend (fallback)")
         return simulator
 
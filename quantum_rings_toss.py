@@ -1,27 +1,58 @@
 import argparse
 import time
 import numpy as np
-import matplotlib.pyplot as plt
 
 # Import our modules
-from quantum_rings_coin import single_quantum_coin_toss, batched_quantum_coin_toss, biased_quantum_coin
-from quantum_rings_provider import create_rings_backend
+from quantum_rings_coin import batched_quantum_coin_toss, seed_rng
 from quantum_stats import analyze_coin_tosses, print_analysis, plot_results
-from quantum_visualizer import QuantumVisualizer
 
-def run_experiment(num_tosses=100, use_hardware=False, batch_size=50, 
-                  visualize=True, delay=0.05, bias_angle=None):
+# Minimum number of seconds between progress updates
+PROGRESS_INTERVAL = 0.2
+
+# Random generator used to sample the biased coin
+_RNG = np.random.default_rng()
+
+# Shortest time between redraws (about 30 frames per second)
+MIN_FRAME_INTERVAL = 1 / 30
+
+def seed_rngs(seed=None):
+    """
+    Reseed every generator used for simulated tosses
+    
+    The fair tosses in quantum_rings_coin and the biased tosses here get
+    independent streams derived from the same seed.
+    
+    Args:
+        seed: Integer seed; None draws fresh entropy from the OS
+    """
+    global _RNG
+    coin_seed, toss_seed = np.random.SeedSequence(seed).spawn(2)
+    seed_rng(coin_seed)
+    _RNG = np.random.default_rng(toss_seed)
+
+# Tosses per job on hardware when no batch size is given
+DEFAULT_BATCH_SIZE = 50
+
+def run_experiment(num_tosses=100, use_hardware=False, batch_size=None, 
+                  visualize=True, delay=0.05, bias_angle=None, seed=None):
     """
     Run a complete quantum coin toss experiment with visualization and analysis
     
     Args:
         num_tosses: Total number of coin tosses to perform
         use_hardware: Whether to use hardware acceleration
-        batch_size: Number of tosses per batch for efficiency
+        batch_size: Number of tosses per batch; if None, chosen automatically
+                    (every toss in one batch without visualization, about
+                    50 updates with it, DEFAULT_BATCH_SIZE on hardware)
         visualize: Whether to show real-time visualization
-        delay: Delay between visualization updates (seconds)
+        delay: Time between visualization updates (seconds); while
+               visualizing, each batch waits out the rest of this delay
         bias_angle: If set, creates a biased coin with the given angle (radians)
+        seed: If set, reseeds the generators so simulated runs are reproducible
     """
+    if seed is not None:
+        seed_rngs(seed)
+    
     # Setup experiment description
     experiment_type = "Biased" if bias_angle is not None else "Fair"
     hardware_type = "Hardware-Accelerated" if use_hardware else "Simulated"
@@ -38,56 +69,68 @@ def run_experiment(num_tosses=100, use_hardware=False, batch_size=50,
     # Initialize visualizer if requested with optimized settings
     visualizer = None
     if visualize:
+        # Imported here so that --no-viz runs never load matplotlib
+        from quantum_visualizer import QuantumVisualizer
         visualizer = QuantumVisualizer(update_interval=500)  # Less frequent updates
         visualizer.start_visualization(title=experiment_name)
     
-    # Storage for results
-    results = []
+    # Pick a batch size when none was given. Remote backends can cap the
+    # shots per job, so hardware runs keep the fixed default; locally every
+    # toss can go in a single batch without plots, and with plots the
+    # batches grow so the display updates about 50 times
+    if batch_size is None:
+        if use_hardware:
+            batch_size = DEFAULT_BATCH_SIZE
+        elif not visualize:
+            batch_size = max(num_tosses, 1)
+        else:
+            batch_size = max(1, num_tosses // 50)
+    
+    # Storage for results, preallocated since the total is known
+    results = np.empty(num_tosses, dtype=np.int8)
     
     try:
         # Process in batches for efficiency
         tosses_completed = 0
         start_time = time.time()
-        
-        # Calculate optimal batch sizes
-        remaining_tosses = num_tosses
+        last_progress = time.monotonic()
         
         while tosses_completed < num_tosses:
+            batch_start = time.monotonic()
             current_batch_size = min(batch_size, num_tosses - tosses_completed)
             
             if bias_angle is not None:
-                # Generate biased coin tosses
-                _, _, _ = biased_quantum_coin(bias_angle, shots=current_batch_size)
-                
-                # Generate individual tosses for visualization
-                batch_results = []
-                for _ in range(current_batch_size):
-                    r = np.random.random()
-                    if r < np.cos(bias_angle/2)**2:
-                        batch_results.append(0)
-                    else:
-                        batch_results.append(1)
+                # Generate the whole batch of biased tosses in one draw
+                batch_results = (_RNG.random(current_batch_size) >= p0_theory).astype(np.int8)
             else:
                 # Generate fair quantum coin tosses with optimized batching
                 batch_results = batched_quantum_coin_toss(current_batch_size, use_hardware)
             
             # Add all results at once
-            results.extend(batch_results)
+            results[tosses_completed:tosses_completed + len(batch_results)] = batch_results
             
             # Update visualization (only once per batch)
             if visualizer:
                 visualizer.add_result(batch_results)
                 
-                # Only pause once per batch
-                if delay > 0:
-                    plt.pause(delay)
+                # Repaint in place, at a capped frame rate
+                visualizer.refresh(min_interval=MIN_FRAME_INTERVAL)
+                
+                # Pace the run so the plots animate, sleeping only for the
+                # part of the delay the batch did not already take
+                remaining = delay - (time.monotonic() - batch_start)
+                if remaining > 0:
+                    time.sleep(remaining)
             
-            # Update progress
+            # Update progress, at most a few times per second so that printing
+            # does not throttle fast runs
             tosses_completed += len(batch_results)
-            elapsed = time.time() - start_time
-            rate = tosses_completed / elapsed if elapsed > 0 else 0
+            now = time.monotonic()
             
-            if tosses_completed % batch_size == 0 or tosses_completed == num_tosses:
+            if now - last_progress >= PROGRESS_INTERVAL or tosses_completed == num_tosses:
+                last_progress = now
+                elapsed = time.time() - start_time
+                rate = tosses_completed / elapsed if elapsed > 0 else 0
                 print(f"Progress: {tosses_completed}/{num_tosses} tosses completed ({rate:.1f} tosses/sec)")
                 
     except KeyboardInterrupt:
@@ -100,8 +143,11 @@ def run_experiment(num_tosses=100, use_hardware=False, batch_size=50,
         print(f"\nExperiment completed in {total_time:.2f} seconds")
         print(f"Average rate: {toss_rate:.1f} tosses per second")
         
+        # Keep only the tosses that completed before any interruption
+        results = results[:tosses_completed]
+        
         # Run statistical analysis if we have results
-        if results:
+        if len(results):
             analysis = analyze_coin_tosses(results)
             print_analysis(analysis)
             
@@ -117,6 +163,8 @@ def run_experiment(num_tosses=100, use_hardware=False, batch_size=50,
         
         # Save visualization if active
         if visualize and visualizer:
+            # Draw any results that arrived since the last frame
+            visualizer.refresh()
             filename = f"quantum_coin_{experiment_type.lower()}_{hardware_type.lower()}.png"
             visualizer.save_visualization(filename)
             print(f"Visualization saved as {filename}")
@@ -136,16 +184,23 @@ def main():
                         help='Number of coin tosses to perform')
     parser.add_argument('--hardware', action='store_true',
                         help='Use hardware acceleration')
-    parser.add_argument('--batch-size', type=int, default=50,  # Increased from 10
-                        help='Number of tosses per batch for efficiency')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='Number of tosses per batch (default: chosen automatically)')
     parser.add_argument('--no-viz', action='store_true',
                         help='Disable visualization')
     parser.add_argument('--delay', type=float, default=0.05,  # Reduced from 0.1
                         help='Delay between visualization updates (seconds)')
     parser.add_argument('--bias', type=float, default=None,
                         help='Set bias angle in radians (0 to π)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Benchmark mode: implies --no-viz and --delay 0')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for reproducible simulated tosses')
     
     args = parser.parse_args()
+    if args.benchmark:
+        args.no_viz = True
+        args.delay = 0
     
     # Run the experiment
     run_experiment(
@@ -154,7 +209,8 @@ def main():
         batch_size=args.batch_size,
         visualize=not args.no_viz,
         delay=args.delay,
-        bias_angle=args.bias
+        bias_angle=args.bias,
+        seed=args.seed
     )
 
 if __name__ == "__main__":
@@ -1,24 +1,93 @@
+import math
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
+
+# Numba is optional; without it the NumPy implementation is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _fused_toss_stats(arr):
+    """
+    Count ones, runs and adjacent 1-1 pairs of a 0/1 array in a single pass
+    
+    Returns:
+        tuple: (ones, max_run, total_runs, pairs)
+    """
+    # Accumulate in int64 so the uint8 elements never set the sum's dtype
+    ones = np.int64(arr[0])
+    max_run = 0
+    total_runs = 1
+    current_run = 1
+    pairs = np.int64(0)
+    
+    for i in range(1, arr.shape[0]):
+        ones += np.int64(arr[i])
+        pairs += np.int64(arr[i] & arr[i-1])
+        if arr[i] == arr[i-1]:
+            current_run += 1
+        else:
+            if current_run > max_run:
+                max_run = current_run
+            total_runs += 1
+            current_run = 1
+    
+    # Account for the last run
+    if current_run > max_run:
+        max_run = current_run
+    
+    return ones, max_run, total_runs, pairs
+
+# JIT-compile the fused kernel when numba is available
+_fused_toss_stats = njit(cache=True)(_fused_toss_stats) if njit else None
+
+def compute_run_lengths(arr):
+    """
+    Split a sequence of outcomes into runs of identical values
+    
+    Args:
+        arr: NumPy array of outcomes
+        
+    Returns:
+        np.ndarray: Length of each run, in order
+    """
+    if arr.size == 0:
+        return np.empty(0, dtype=np.int64)
+    # Runs start wherever the outcome differs from the previous one
+    boundaries = np.flatnonzero(arr[1:] != arr[:-1]) + 1
+    return np.diff(np.concatenate(([0], boundaries, [arr.size])))
 
 def analyze_coin_tosses(results):
     """
     Analyze the statistics of a sequence of coin tosses
     
     Args:
-        results: List of 0s and 1s representing coin toss outcomes
+        results: Sequence or array of 0s and 1s representing coin toss outcomes
         
     Returns:
         dict: Dictionary containing statistical analysis results
     """
-    if not results:
+    if len(results) == 0:
         return {"error": "No results provided"}
     
-    # Basic counts
-    total = len(results)
-    zeros = results.count(0)
-    ones = results.count(1)
+    arr = np.asarray(results, dtype=np.uint8)
+    total = arr.size
+    
+    if _fused_toss_stats is not None:
+        # Counts, run statistics and 1-1 pairs from one compiled pass
+        ones, max_run, total_runs, pairs = (int(v) for v in _fused_toss_stats(arr))
+        zeros = total - ones
+    else:
+        # Basic counts in a single vectorized pass
+        zeros, ones = (int(c) for c in np.bincount(arr, minlength=2)[:2])
+        
+        # Calculate run statistics from the positions where the outcome changes
+        runs = compute_run_lengths(arr)
+        max_run = int(runs.max())
+        total_runs = runs.size
+        
+        # Adjacent 1-1 pairs, used for the autocorrelation
+        pairs = int(np.count_nonzero(arr[:-1] & arr[1:]))
     
     # Probabilities
     p0 = zeros / total
@@ -27,24 +96,10 @@ def analyze_coin_tosses(results):
     # Bias from fair coin (0.5)
     bias = abs(p1 - 0.5)
     
-    # Calculate run statistics
-    runs = []
-    current_run = 1
-    
-    for i in range(1, len(results)):
-        if results[i] == results[i-1]:
-            current_run += 1
-        else:
-            runs.append(current_run)
-            current_run = 1
-    
-    # Add the last run
-    runs.append(current_run)
-    
     # Calculate entropy (measure of randomness)
     # Shannon entropy is -sum(p_i * log2(p_i))
-    if p0 > 0 and p1 > 0:
-        entropy = -p0 * np.log2(p0) - p1 * np.log2(p1)
+    if p0 * p1 > 0:
+        entropy = -p0 * math.log2(p0) - p1 * math.log2(p1)
     else:
         entropy = 0  # One of the probabilities is 0
     
@@ -52,15 +107,23 @@ def analyze_coin_tosses(results):
     entropy_ratio = entropy / 1.0
     
     # Chi-squared test for goodness of fit to uniform distribution
-    expected = [total/2, total/2]  # Expected counts for fair coin
-    observed = [zeros, ones]
-    chi2, p_value = stats.chisquare(observed, expected)
+    # With expected counts of total/2 each this reduces to (zeros - ones)²/total,
+    # and for one degree of freedom the p-value is erfc(sqrt(chi2/2))
+    chi2 = (zeros - ones) ** 2 / total
+    p_value = math.erfc(math.sqrt(chi2 / 2))
     
     # Autocorrelation at lag 1 (measure of independence)
-    if len(results) > 1:
-        autocorr = np.corrcoef(results[:-1], results[1:])[0, 1]
-    else:
-        autocorr = 0
+    # Pearson correlation of each toss with the next, from the number of ones
+    # in each slice and the number of adjacent 1-1 pairs; for 0/1 data the sum
+    # of squares equals the sum, so no other products are needed
+    autocorr = 0
+    if total > 1:
+        n = total - 1
+        mean_a = (ones - int(arr[-1])) / n
+        mean_b = (ones - int(arr[0])) / n
+        var_product = mean_a * (1 - mean_a) * mean_b * (1 - mean_b)
+        if var_product > 0:
+            autocorr = (pairs / n - mean_a * mean_b) / math.sqrt(var_product)
     
     # Compile the results
     analysis = {
@@ -71,9 +134,9 @@ def analyze_coin_tosses(results):
         "p1": p1,
         "bias": bias,
         "runs": {
-            "total_runs": len(runs),
-            "max_run": max(runs) if runs else 0,
-            "avg_run": np.mean(runs) if runs else 0
+            "total_runs": total_runs,
+            "max_run": max_run,
+            "avg_run": total / total_runs
         },
         "entropy": {
             "value": entropy,
@@ -118,30 +181,34 @@ def print_analysis(analysis):
 
 def plot_results(results, title="Quantum Coin Tosses"):
     """Create visualizations for coin toss results"""
-    if not results:
+    arr = np.asarray(results, dtype=np.uint8)
+    if arr.size == 0:
         print("No results to plot")
         return
     
+    # Imported here so that analysis alone does not pay for matplotlib
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import to_rgba_array
+    
     plt.figure(figsize=(15, 10))
     
     # Plot 1: Distribution
     plt.subplot(2, 2, 1)
-    values, counts = np.unique(results, return_counts=True)
-    plt.bar([0, 1], [results.count(0), results.count(1)])
+    plt.bar([0, 1], np.bincount(arr, minlength=2)[:2])
     plt.xticks([0, 1], ['Heads (0)', 'Tails (1)'])
     plt.ylabel('Frequency')
     plt.title('Outcome Distribution')
     
     # Add reference line for expected counts
-    expected = len(results) / 2
+    expected = arr.size / 2
     plt.axhline(y=expected, color='r', linestyle='--', alpha=0.7, label='Expected (50%)')
     plt.legend()
     
     # Plot 2: Running probability
     plt.subplot(2, 2, 2)
-    x = list(range(1, len(results) + 1))
-    # Calculate running probability of 1
-    running_prob = [results[:i+1].count(1) / (i+1) for i in range(len(results))]
+    x = np.arange(1, arr.size + 1)
+    # Calculate running probability of 1 from the cumulative count of ones
+    running_prob = np.cumsum(arr) / x
     
     plt.plot(x, running_prob, 'b-')
     plt.axhline(y=0.5, color='r', linestyle='--', alpha=0.7, label='Expected (0.5)')
@@ -152,10 +219,10 @@ def plot_results(results, title="Quantum Coin Tosses"):
     
     # Plot 3: Last 50 tosses
     plt.subplot(2, 2, 3)
-    recent_data = results[-50:] if len(results) > 50 else results
-    indices = list(range(len(recent_data)))
+    recent_data = arr[-50:]
+    indices = np.arange(recent_data.size)
     
-    plt.scatter(indices, recent_data, c=['blue' if x == 0 else 'orange' for x in recent_data])
+    plt.scatter(indices, recent_data, c=to_rgba_array(['blue', 'orange'])[recent_data])
     plt.yticks([0, 1], ['Heads (0)', 'Tails (1)'])
     plt.xlabel('Toss Number')
     plt.title('Last 50 Tosses')
@@ -163,26 +230,21 @@ def plot_results(results, title="Quantum Coin Tosses"):
     # Plot 4: Run length histogram
     plt.subplot(2, 2, 4)
     
-    # Calculate run lengths
-    runs = []
-    current_run = 1
-    for i in range(1, len(results)):
-        if results[i] == results[i-1]:
-            current_run += 1
-        else:
-            runs.append(current_run)
-            current_run = 1
-    runs.append(current_run)
+    # Calculate run lengths from the positions where the outcome changes
+    runs = compute_run_lengths(arr)
     
-    plt.hist(runs, bins=range(1, max(runs) + 2), alpha=0.7, align='left')
+    # Count runs of each length; index k holds the number of runs of length k
+    run_counts = np.bincount(runs)
+    max_run = run_counts.size - 1
+    x = np.arange(1, max_run + 1)
+    
+    plt.bar(x, run_counts[1:], width=1.0, alpha=0.7)
     plt.xlabel('Run Length')
     plt.ylabel('Frequency')
     plt.title('Run Length Distribution')
     
     # Optional: Add theoretical exponential decay for fair coin
-    max_run = max(runs)
-    x = np.arange(1, max_run + 1)
-    y = [len(runs) * 0.5**i for i in x]
+    y = runs.size * 0.5 ** x
     plt.plot(x, y, 'r--', label='Theory: P(run=k) ∝ 2^-k')
     plt.legend()
     
@@ -195,10 +257,10 @@ def plot_results(results, title="Quantum Coin Tosses"):
 
 if __name__ == "__main__":
     # Test with simulated fair coin data
-    from basic_quantum_coin import batched_quantum_coin_toss
+    from quantum_rings_coin import batched_quantum_coin_toss
     
     print("Generating quantum coin tosses for analysis...")
-    results = batched_quantum_coin_toss(num_tosses=100)
+    results = batched_quantum_coin_toss(100)
     
     # Run analysis
     analysis = analyze_coin_tosses(results)
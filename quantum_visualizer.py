@@ -5,10 +5,19 @@ This module provides visualization tools for quantum randomness experiments
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.animation import FuncAnimation
+from matplotlib.colors import to_rgba_array
 import threading
 import time
 import collections
 
+from quantum_stats import compute_run_lengths
+
+# Color of each outcome, with matching RGBA lookup tables indexed by outcome
+COIN_COLORS = ['blue', 'orange']
+QUTRIT_COLORS = ['blue', 'green', 'orange']
+_COIN_LUT = to_rgba_array(COIN_COLORS)
+_QUTRIT_LUT = to_rgba_array(QUTRIT_COLORS)
+
 class QuantumVisualizer:
     """Class to visualize quantum randomness in real-time"""
     
@@ -19,7 +28,7 @@ class QuantumVisualizer:
         Args:
             max_samples: Maximum number of samples to display in history
         """
-        self.results = []
+        self.results = collections.deque(maxlen=max_samples)
         self.running = False
         self.fig = None
         self.animation = None
@@ -31,25 +40,57 @@ class QuantumVisualizer:
         self.is_qutrit = False
         
         # For run tracking
-        self.run_lengths = collections.deque(maxlen=max_samples)
+        self.run_lengths = np.empty(0, dtype=np.int64)
         
         # For performance optimization
         self._last_data_len = 0
         
+        # Sample numbers 1..max_samples, shared by every frame as the x axis
+        # and the divisor of the running probabilities
+        self._sample_numbers = np.arange(1, max_samples + 1)
+        
+        # Fair-coin run length probabilities 2^-k for every possible run length
+        self._theory_decay = 0.5 ** self._sample_numbers
+        
+        # Set when new results arrive, cleared once they have been drawn
+        self._dirty = False
+        
+        # Time of the last refresh, used to cap the frame rate
+        self._last_draw = 0.0
+        
     def add_result(self, result):
         """Add a new measurement result"""
         with self.lock:
-            # Handle single result or batch of results
+            self._dirty = True
+            
+            # Handle single result or batch of results; the deque keeps
+            # only the most recent max_samples
             if isinstance(result, (list, tuple, np.ndarray)):
                 self.results.extend(result)
-                # Keep only the most recent max_samples
-                if len(self.results) > self.max_samples:
-                    self.results = self.results[-self.max_samples:]
             else:
                 self.results.append(result)
-                # Keep only the most recent max_samples
-                if len(self.results) > self.max_samples:
-                    self.results.pop(0)
+    
+    def refresh(self, min_interval=0):
+        """
+        Draw any pending results and process GUI events immediately
+        
+        Unlike plt.pause this does not sleep or run a full event loop, so
+        callers can repaint once per batch without slowing the experiment.
+        
+        Args:
+            min_interval: Minimum number of seconds between redraws; calls
+                          arriving sooner are skipped
+        """
+        if not self.fig:
+            return
+        now = time.monotonic()
+        if now - self._last_draw < min_interval:
+            return
+        self._last_draw = now
+        self._update_plots(None)
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+    
     def start_visualization(self, title="Quantum Randomness Visualization", is_qutrit=False):
         """Start the visualization thread"""
         self.is_qutrit = is_qutrit
@@ -73,8 +114,6 @@ class QuantumVisualizer:
             self.axes[1].set_xlabel("Sample")
             self.axes[1].set_ylabel("Probability")
             self.axes[1].set_ylim(0, 0.5)
-            self.axes[1].axhline(y=1/3, color='r', linestyle='--', alpha=0.7, label='Ideal (1/3)')
-            self.axes[1].legend()
             
             self.axes[2].set_title("Last 50 Measurements")
             self.axes[2].set_xlabel("Sample")
@@ -92,8 +131,6 @@ class QuantumVisualizer:
             self.axes[1].set_xlabel("Sample")
             self.axes[1].set_ylabel("Probability of 1 (Tails)")
             self.axes[1].set_ylim(0, 1)
-            self.axes[1].axhline(y=0.5, color='r', linestyle='--', alpha=0.7, label='Ideal (0.5)')
-            self.axes[1].legend()
             
             self.axes[2].set_title("Last 50 Coin Tosses")
             self.axes[2].set_xlabel("Sample")
@@ -107,6 +144,9 @@ class QuantumVisualizer:
         self.axes[3].set_xlabel("Run Length")
         self.axes[3].set_ylabel("Frequency")
         
+        # Create the artists once; frames only update their data
+        self._create_artists()
+        
         # Start the animation
         self.animation = FuncAnimation(
             self.fig, 
@@ -121,145 +161,112 @@ class QuantumVisualizer:
         plt.draw()
         plt.pause(0.5)  # Force initial render
     
+    def _create_artists(self):
+        """Create the plot artists that _update_plots keeps updating"""
+        num_outcomes = 3 if self.is_qutrit else 2
+        colors = QUTRIT_COLORS if self.is_qutrit else COIN_COLORS
+        
+        # RGBA lookup table indexed by outcome, used to color the scatter
+        self._outcome_colors = _QUTRIT_LUT if self.is_qutrit else _COIN_LUT
+        
+        # Plot 1: One bar per outcome plus the ideal count
+        self._dist_bars = self.axes[0].bar(np.arange(num_outcomes), np.zeros(num_outcomes), color=colors)
+        self._dist_ideal = self.axes[0].axhline(y=0, color='r', linestyle='--', label='Ideal')
+        self.axes[0].legend()
+        
+        # Plot 2: Running probability of each outcome (only P(1) for a coin)
+        if self.is_qutrit:
+            self._prob_lines = [
+                self.axes[1].plot([], [], style, label=f'P({i})', alpha=0.7)[0]
+                for i, style in enumerate(['b-', 'g-', 'orange'])
+            ]
+            self.axes[1].axhline(y=1/3, color='r', linestyle='--', alpha=0.7, label='Ideal (1/3)')
+        else:
+            self._prob_lines = [self.axes[1].plot([], [], 'b-')[0]]
+            self.axes[1].axhline(y=0.5, color='r', linestyle='--', alpha=0.7, label='Ideal (0.5)')
+        self.axes[1].legend()
+        
+        # Plot 3: Last 50 measurements
+        self._recent_scatter = self.axes[2].scatter([], [])
+        self.axes[2].set_xlim(-2.5, 51.5)
+        
+        # Plot 4: One bar per possible run length, plus the fair-coin theory
+        self._run_bars = self.axes[3].bar(self._sample_numbers, np.zeros(self.max_samples))
+        self._run_theory = None
+        if not self.is_qutrit:
+            self._run_theory, = self.axes[3].plot([], [], 'r--', label='Theory')
+            self.axes[3].legend()
+    
     def _update_plots(self, frame):
         """Update function for the animation"""
         with self.lock:
-            data = list(self.results)  # Make a copy to avoid thread issues
+            # Nothing new since the last frame, keep the current drawing
+            if not self._dirty:
+                return self.axes
+            self._dirty = False
+            # Make a copy to avoid thread issues
+            arr = np.fromiter(self.results, dtype=np.int8, count=len(self.results))
         
-        if not data:
+        if arr.size == 0:
             return self.axes
         
-        # Clear all axes
-        for ax in self.axes:
-            ax.clear()
-        
         # Plot 1: Distribution
-        if self.is_qutrit:
-            values, counts = np.unique(data, return_counts=True)
-            self.axes[0].bar(values, counts, color=['blue', 'green', 'orange'])
-            self.axes[0].set_title("Measurement Distribution")
-            self.axes[0].set_xlabel("Outcome")
-            self.axes[0].set_ylabel("Frequency")
-            self.axes[0].set_xticks([0, 1, 2])
-            
-            # Add ideal reference
-            total = len(data)
-            if total > 0:
-                for i in range(3):
-                    if i not in values:
-                        values = np.append(values, i)
-                        counts = np.append(counts, 0)
-                ideal = total / 3
-                self.axes[0].axhline(y=ideal, color='r', linestyle='--', label='Ideal')
-                self.axes[0].legend()
-        else:
-            values, counts = np.unique(data, return_counts=True)
-            self.axes[0].bar([0, 1], [data.count(0), data.count(1)], color=['blue', 'orange'])
-            self.axes[0].set_title("Coin Toss Distribution")
-            self.axes[0].set_xlabel("Outcome")
-            self.axes[0].set_ylabel("Frequency")
-            self.axes[0].set_xticks([0, 1])
-            self.axes[0].set_xticklabels(['0 (Heads)', '1 (Tails)'])
-            
-            # Add ideal reference
-            ideal = len(data) / 2
-            self.axes[0].axhline(y=ideal, color='r', linestyle='--', label='Ideal')
-            self.axes[0].legend()
+        counts = np.bincount(arr, minlength=len(self._dist_bars))
+        for bar, count in zip(self._dist_bars, counts):
+            bar.set_height(count)
+        
+        # Ideal reference
+        ideal = arr.size / len(self._dist_bars)
+        self._dist_ideal.set_ydata([ideal, ideal])
+        self.axes[0].set_ylim(0, max(counts.max(), ideal) * 1.05)
         
         # Plot 2: Running probability
-        x = list(range(1, len(data) + 1))
+        x = self._sample_numbers[:arr.size]
         if self.is_qutrit:
-            # Calculate running probabilities for each outcome
-            running_p0 = [data[:i+1].count(0) / (i+1) for i in range(len(data))]
-            running_p1 = [data[:i+1].count(1) / (i+1) for i in range(len(data))]
-            running_p2 = [data[:i+1].count(2) / (i+1) for i in range(len(data))]
-            
-            self.axes[1].plot(x, running_p0, 'b-', label='P(0)', alpha=0.7)
-            self.axes[1].plot(x, running_p1, 'g-', label='P(1)', alpha=0.7)
-            self.axes[1].plot(x, running_p2, 'orange', label='P(2)', alpha=0.7)
-            self.axes[1].set_title("Running Probability")
-            self.axes[1].set_xlabel("Sample")
-            self.axes[1].set_ylabel("Probability")
-            self.axes[1].set_ylim(0, 0.5)
-            self.axes[1].axhline(y=1/3, color='r', linestyle='--', alpha=0.7, label='Ideal (1/3)')
-            self.axes[1].legend()
+            # Calculate running probabilities for each outcome from cumulative counts
+            running = [np.cumsum(arr == i) / x for i in range(3)]
         else:
-            # Calculate running probability of 1
-            running_prob = [data[:i+1].count(1) / (i+1) for i in range(len(data))]
-            
-            self.axes[1].plot(x, running_prob, 'b-')
-            self.axes[1].set_title("Running Probability")
-            self.axes[1].set_xlabel("Sample")
-            self.axes[1].set_ylabel("Probability of 1 (Tails)")
-            self.axes[1].set_ylim(0, 1)
-            self.axes[1].axhline(y=0.5, color='r', linestyle='--', alpha=0.7, label='Ideal (0.5)')
-            self.axes[1].legend()
+            # Calculate running probability of 1 from the cumulative count of ones
+            running = [np.cumsum(arr) / x]
+        for line, running_prob in zip(self._prob_lines, running):
+            line.set_data(x, running_prob)
+        self.axes[1].set_xlim(0, arr.size + 1)
         
         # Plot 3: Last 50 measurements
-        recent_data = data[-50:] if len(data) > 50 else data
-        indices = list(range(len(recent_data)))
-        
-        if self.is_qutrit:
-            colors = ['blue' if x == 0 else 'green' if x == 1 else 'orange' for x in recent_data]
-            self.axes[2].scatter(indices, recent_data, color=colors)
-            self.axes[2].set_title("Last 50 Measurements")
-            self.axes[2].set_xlabel("Sample")
-            self.axes[2].set_ylabel("Outcome")
-            self.axes[2].set_ylim(-0.5, 2.5)
-            self.axes[2].set_yticks([0, 1, 2])
-        else:
-            colors = ['blue' if x == 0 else 'orange' for x in recent_data]
-            self.axes[2].scatter(indices, recent_data, color=colors)
-            self.axes[2].set_title("Last 50 Coin Tosses")
-            self.axes[2].set_xlabel("Sample")
-            self.axes[2].set_ylabel("Outcome")
-            self.axes[2].set_ylim(-0.5, 1.5)
-            self.axes[2].set_yticks([0, 1])
-            self.axes[2].set_yticklabels(['0 (Heads)', '1 (Tails)'])
+        recent_data = arr[-50:]
+        indices = np.arange(recent_data.size)
+        self._recent_scatter.set_offsets(np.column_stack([indices, recent_data]))
+        self._recent_scatter.set_color(self._outcome_colors[recent_data])
         
         # Plot 4: Run length analysis
-        self._update_run_lengths(data)
-        if self.run_lengths:
-            values, counts = np.unique(self.run_lengths, return_counts=True)
-            self.axes[3].bar(values, counts)
-            self.axes[3].set_title("Run Length Distribution")
-            self.axes[3].set_xlabel("Run Length")
-            self.axes[3].set_ylabel("Frequency")
+        self._update_run_lengths(arr)
+        if self.run_lengths.size:
+            run_lengths = self.run_lengths
+            run_counts = np.bincount(run_lengths, minlength=self.max_samples + 1)[1:]
+            for bar, count in zip(self._run_bars, run_counts):
+                bar.set_height(count)
+            
+            max_run = run_lengths.max()
+            top = run_counts.max()
             
             # Optional: Add theoretical exponential decay for fair coin
-            if not self.is_qutrit:
-                max_run = max(self.run_lengths)
-                x = np.arange(1, max_run + 1)
-                y = [len(self.run_lengths) * 0.5**i for i in x]
-                self.axes[3].plot(x, y, 'r--', label='Theory')
-                self.axes[3].legend()
-        
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.9)
+            if self._run_theory is not None:
+                x = self._sample_numbers[:max_run]
+                y = run_lengths.size * self._theory_decay[:max_run]
+                self._run_theory.set_data(x, y)
+                top = max(top, y[0])
+            
+            self.axes[3].set_xlim(0.4, max_run + 0.6)
+            self.axes[3].set_ylim(0, top * 1.05)
         
         return self.axes
     
     def _update_run_lengths(self, data):
         """Update the run length statistics"""
-        if not data:
+        if len(data) == 0:
             return
         
-        # Calculate run lengths
-        run_lengths = []
-        current_run = 1
-        
-        for i in range(1, len(data)):
-            if data[i] == data[i-1]:
-                current_run += 1
-            else:
-                run_lengths.append(current_run)
-                current_run = 1
-        
-        # Add the last run
-        run_lengths.append(current_run)
-        
-        # Update the deque
-        self.run_lengths = collections.deque(run_lengths, maxlen=self.max_samples)
+        self.run_lengths = compute_run_lengths(np.asarray(data, dtype=np.int8))
     
     def stop_visualization(self):
         """Stop the visualization"""
@@ -279,17 +286,18 @@ class QuantumVisualizer:
 
 # Example usage (when run directly)
 if __name__ == "__main__":
-    import random
+    # Demo random coin tosses, simulated up front in one draw
+    tosses = np.random.default_rng().integers(0, 2, size=200, dtype=np.int8)
     
-    # Demo random coin tosses
     visualizer = QuantumVisualizer()
     visualizer.start_visualization(title="Demo Coin Toss Visualization")
     
     try:
-        for _ in range(200):
-            # Simulate a coin toss
-            result = random.randint(0, 1)
+        for result in tosses:
             visualizer.add_result(result)
+            
+            # Repaint and process GUI events, then pace the demo
+            visualizer.refresh()
             time.sleep(0.05)
     except KeyboardInterrupt:
         print("Interrupted by user")
@@ -2,6 +2,33 @@ import os
 import sys
 import subprocess
 import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# importlib.metadata (Python 3.8+) and packaging are optional; without them
+# every requirement is passed to pip
+try:
+    from importlib import metadata
+    from packaging.requirements import Requirement
+except ImportError:
+    metadata = None
+    Requirement = None
+
+# Base pip command: take an existing wheel over a newer sdist that would need
+# building, and skip byte-compiling at install time (.pyc files are written
+# on first import anyway)
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-compile"]
+PIP_DOWNLOAD = [sys.executable, "-m", "pip", "download", "--prefer-binary"]
+
+# Instructions for making the token permanent, keyed by shell name
+SHELL_TEMPLATES = {
+    'bash': "\nFor bash, add to ~/.bashrc or ~/.bash_profile:\n"
+            "echo 'export QUANTUM_RINGS_TOKEN=\"{token}\"' >> ~/.bashrc",
+    'zsh': "\nFor zsh, add to ~/.zshrc:\n"
+           "echo 'export QUANTUM_RINGS_TOKEN=\"{token}\"' >> ~/.zshrc",
+    'fish': "\nFor fish, use:\n"
+            "set -Ux QUANTUM_RINGS_TOKEN \"{token}\"",
+}
 
 def check_python_version():
     """Check if the Python version is compatible"""
@@ -16,32 +43,119 @@ def check_python_version():
     print(f"✅ Python version {current_version[0]}.{current_version[1]} is compatible")
     return True
 
-def install_requirements():
-    """Install required packages"""
+def is_satisfied(requirement):
+    """
+    Check whether a requirement is already installed at a matching version
+    
+    Args:
+        requirement: Requirement string such as "numpy>=1.24.0"
+        
+    Returns:
+        bool: True if pip can be skipped for this requirement
+    """
+    if Requirement is None:
+        return False
+    req = Requirement(requirement)
+    try:
+        installed = metadata.version(req.name)
+    except metadata.PackageNotFoundError:
+        return False
+    return req.specifier.contains(installed, prereleases=True)
+
+def install_requirements(jobs=1):
+    """
+    Install required packages
+    
+    Args:
+        jobs: Number of packages to download at the same time
+    """
     requirements = [
         "qiskit>=1.0.0",
         "qiskit-aer>=0.12.0",
         "matplotlib>=3.7.0",
-        "numpy>=1.24.0",
-        "scipy>=1.10.0"
+        "numpy>=1.24.0"
     ]
     
     print("Installing base requirements...")
+    
+    # Only call pip for requirements that are missing or outdated
+    pending = []
     for req in requirements:
+        if is_satisfied(req):
+            print(f"✅ {req} already satisfied")
+        else:
+            pending.append(req)
+    requirements = pending
+    if not requirements:
+        return True
+    
+    if jobs > 1:
+        return _install_downloaded(requirements, jobs)
+    
+    # Hand every requirement to a single pip run so it starts and resolves once
+    try:
+        subprocess.check_call([*PIP_INSTALL, *requirements])
+        print(f"✅ Installed {', '.join(requirements)}")
+        return True
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install base requirements")
+        return False
+
+def _install_downloaded(requirements, jobs):
+    """
+    Download requirements concurrently, then install them with a single pip run
+    
+    pip does not support concurrent installs into one environment, so only
+    the downloads overlap. Each requirement gets its own directory so that
+    shared dependencies are never written by two pip processes at once.
+    
+    Args:
+        requirements: Requirement strings to install
+        jobs: Number of pip download processes to run at the same time
+        
+    Returns:
+        bool: True if every requirement was installed
+    """
+    with tempfile.TemporaryDirectory() as download_dir:
+        dirs = {req: os.path.join(download_dir, str(i)) for i, req in enumerate(requirements)}
+        
+        # pip output is captured so that the concurrent downloads do not
+        # interleave on the terminal
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(jobs, len(requirements))) as executor:
+            futures = {
+                executor.submit(subprocess.run, [*PIP_DOWNLOAD, "-d", dirs[req], req],
+                                capture_output=True): req
+                for req in requirements
+            }
+            for future in as_completed(futures):
+                req = futures[future]
+                if future.result().returncode == 0:
+                    print(f"✅ Downloaded {req}")
+                else:
+                    print(f"❌ Failed to download {req}")
+                    failed.append(req)
+        if failed:
+            return False
+        
+        # Install everything from the downloaded files in one pip run
+        find_links = [arg for req in requirements for arg in ("--find-links", dirs[req])]
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", req])
-            print(f"✅ Installed {req}")
+            subprocess.check_call([*PIP_INSTALL, "--no-index", *find_links, *requirements])
+            print(f"✅ Installed {', '.join(requirements)}")
+            return True
         except subprocess.CalledProcessError:
-            print(f"❌ Failed to install {req}")
+            print("❌ Failed to install base requirements")
             return False
-    
-    return True
 
 def install_quantum_rings():
     """Install Quantum Rings SDK"""
     print("\nInstalling Quantum Rings SDK...")
+    if is_satisfied("quantumrings>=1.0.0"):
+        print("✅ Quantum Rings SDK already installed")
+        return True
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "quantumrings>=1.0.0"])
+        subprocess.check_call([*PIP_INSTALL, "quantumrings>=1.0.0"])
         print("✅ Quantum Rings SDK installed successfully")
         return True
     except subprocess.CalledProcessError:
@@ -61,15 +175,9 @@ def configure_environment(token=None):
         
         # Detect shell type and suggest the right file
         shell = os.environ.get('SHELL', '')
-        if 'bash' in shell:
-            print("\nFor bash, add to ~/.bashrc or ~/.bash_profile:")
-            print(f"echo 'export QUANTUM_RINGS_TOKEN=\"{token}\"' >> ~/.bashrc")
-        elif 'zsh' in shell:
-            print("\nFor zsh, add to ~/.zshrc:")
-            print(f"echo 'export QUANTUM_RINGS_TOKEN=\"{token}\"' >> ~/.zshrc")
-        elif 'fish' in shell:
-            print("\nFor fish, use:")
-            print(f"set -Ux QUANTUM_RINGS_TOKEN \"{token}\"")
+        shell_name = next((name for name in SHELL_TEMPLATES if name in shell), None)
+        if shell_name:
+            print(SHELL_TEMPLATES[shell_name].format(token=token))
     else:
         print("⚠️ No token provided, skipping environment configuration")
         print("You can set the token later with:")
@@ -107,6 +215,8 @@ def main():
     parser.add_argument('--token', type=str, help='Your Quantum Rings API token')
     parser.add_argument('--install', action='store_true', help='Install required packages')
     parser.add_argument('--test', action='store_true', help='Test the setup')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of packages to download in parallel (default: 1)')
     
     args = parser.parse_args()
     
@@ -116,7 +226,7 @@ def main():
         sys.exit(1)
     
     if args.install:
-        if not install_requirements():
+        if not install_requirements(jobs=args.jobs):
             print("⚠️ Some requirements could not be installed")
         
         if not install_quantum_rings():